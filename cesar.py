@@ -1,11 +1,64 @@
+from types import MappingProxyType
 import logging
+from cipher_cache import CompiledCipher, cipher_cache
 
 logger = logging.getLogger("CesarCipher")
 
+class _DropUnknown(dict):
+    """Table de traduction qui supprime les caractères absents de la table."""
+    def __missing__(self, code):
+        return None
+
+def _shift_table(key):
+    """
+    Construit la table de traduction de César pour un décalage donné.
+    Les lettres ASCII (majuscules et minuscules) sont converties en majuscules décalées, les autres caractères supprimés.
+    """
+    table = _DropUnknown()
+    for i in range(26):
+        shifted = chr((i + key) % 26 + 65)
+        table[65 + i] = shifted
+        table[97 + i] = shifted
+    return table
+
+class CompiledCesar(CompiledCipher):
+    __slots__ = ("key", "_encrypt_table", "_decrypt_table")
+
+    def __init__(self, key):
+        """
+        Clé de César compilée : les tables de traduction de chiffrement et de déchiffrement sont précalculées.
+
+        :param key: clé de chiffrement (décalage)
+        """
+        object.__setattr__(self, "key", key)
+        object.__setattr__(self, "_encrypt_table", MappingProxyType(_shift_table(key)))
+        object.__setattr__(self, "_decrypt_table", MappingProxyType(_shift_table(-key)))
+
+    def encrypt(self, chain):
+        return chain.translate(self._encrypt_table)
+
+    def decrypt(self, chain):
+        return chain.translate(self._decrypt_table)
+
 class CesarCipher:
     def __init__(self):
         pass
 
+    def compile(self, key):
+        """
+        Compile une clé de César. L'objet compilé est conservé dans le cache LRU partagé.
+
+        :param key: clé de chiffrement (décalage)
+        :return: objet CompiledCesar
+        """
+        if not isinstance(key, int):
+            logger.error("TypeError : La clé doit être un entier.")
+            raise TypeError("La clé doit être un entier.")
+        if not key:
+            logger.error("ValueError : La clé ne peut pas être vide.")
+            raise ValueError("La clé ne peut pas être vide.")
+        return cipher_cache.get_or_compile("cesar", key, lambda: CompiledCesar(key))
+
     def cesar_encryption(self, chain, key, reverse=False):
         """
         Chiffre une chaîne de caractères en utilisant le chiffrement de César.
@@ -18,26 +71,13 @@ class CesarCipher:
         if not isinstance(chain, str):
             logger.error("TypeError : La chaîne à chiffrer doit être une chaîne de caractères.")
             raise TypeError("La chaîne à chiffrer doit être une chaîne de caractères.")
-        if not isinstance(key, int):
-            logger.error("TypeError : La clé doit être un entier.")
-            raise TypeError("La clé doit être un entier.")
         if not chain:
             logger.error("ValueError : La chaîne à chiffrer ne peut pas être vide.")
             raise ValueError("La chaîne à chiffrer ne peut pas être vide.")
-        if not key:
-            logger.error("ValueError : La clé ne peut pas être vide.")
-            raise ValueError("La clé ne peut pas être vide.")
         
+        compiled = self.compile(key)
         logger.debug("Début du chiffrement avec la clé : %d", key)
-        if reverse:
-            key = -key
-        encoded_chain = ""
-        for letter in chain:
-            car = ord(letter)
-            if 65 <= car <= 90:
-                encoded_chain += chr((car - 65 + key) % 26 + 65)
-            elif 97 <= car <= 122:
-                encoded_chain += chr((car - 97 + key) % 26 + 65)
+        encoded_chain = compiled.decrypt(chain) if reverse else compiled.encrypt(chain)
         logger.debug("Chiffrement terminé.")
         return encoded_chain
     
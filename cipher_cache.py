@@ -0,0 +1,90 @@
+from collections import OrderedDict
+import threading
+import logging
+
+logger = logging.getLogger("CipherCache")
+
+class CompiledCipher:
+    """
+    Classe de base des objets de chiffrement compilés.
+    Les attributs sont fixés à la construction (via object.__setattr__) puis ne peuvent plus être modifiés.
+    """
+    __slots__ = ()
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{type(self).__name__} est immuable.")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"{type(self).__name__} est immuable.")
+
+class CipherCache:
+    def __init__(self, maxsize=128):
+        """
+        Cache LRU borné des objets de chiffrement compilés, partagé entre les modules de chiffrement.
+
+        :param maxsize: nombre maximum d'objets compilés conservés
+        """
+        if not isinstance(maxsize, int) or maxsize < 1:
+            logger.error("ValueError : La taille du cache doit être un entier supérieur à 0.")
+            raise ValueError("La taille du cache doit être un entier supérieur à 0.")
+        self.maxsize = maxsize
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get_or_compile(self, namespace, key, factory):
+        """
+        Renvoie l'objet compilé associé à la clé, ou le construit avec factory s'il est absent.
+        L'entrée la moins récemment utilisée est évincée lorsque le cache est plein.
+
+        :param namespace: nom du chiffrement (évite les collisions de clés entre chiffrements)
+        :param key: clé de chiffrement hachable
+        :param factory: fonction sans argument construisant l'objet compilé
+        :return: objet compilé
+        """
+        cache_key = (namespace, key)
+        with self._lock:
+            compiled = self._entries.get(cache_key)
+            if compiled is not None:
+                self._entries.move_to_end(cache_key)
+                self.hits += 1
+                return compiled
+            self.misses += 1
+
+        logger.debug("Compilation d'une nouvelle clé pour %s.", namespace)
+        compiled = factory()
+        with self._lock:
+            self._entries[cache_key] = compiled
+            self._entries.move_to_end(cache_key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return compiled
+
+    def stats(self):
+        """
+        Renvoie les statistiques d'utilisation du cache.
+
+        :return: dictionnaire contenant hits, misses, hit_rate, size et maxsize
+        """
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / total if total else 0.0,
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+            }
+
+    def clear(self):
+        """
+        Vide le cache et remet les statistiques à zéro.
+        """
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+        logger.debug("Cache des clés compilées vidé.")
+
+cipher_cache = CipherCache()
@@ -1,27 +1,39 @@
 import math
 from zxcvbn import zxcvbn
 import string
+import hashlib
+import numpy as np
 
-def calculate_redundancy(password):
+PASSWORD_INDEX_MAGIC = b"GCPWIDX1"
+PASSWORD_INDEX_HEADER_SIZE = 16
+PASSWORD_INDEX_DTYPE = np.dtype("<u8")
+
+def calculate_redundancy(password, index=None):
     """
     Calculate the redundancy of a password based on its entropy.
     The redundancy is calculated as 1 - (H(X) / Hmax). H(X) is the entropy of the password and Hmax is the maximum entropy.
+    A password found in the common-password index has a redundancy of 1.
     
     :param password: password to analyze
+    :param index: optional PasswordIndex of known-compromised passwords
     :return: redundancy value (0 to 1)"""
     validate_password(password)
-    entropy = calculate_entropy(password)
+    entropy = calculate_entropy(password, index)
     max_entropy = calculate_max_entropy(password)
     return 1 - (entropy/max_entropy)
 
-def calculate_entropy(password):
+def calculate_entropy(password, index=None):
     """
     Calculate the entropy of a password using the zxcvbn library.
     The entropy is calculated as log2(guesses).
+    If a common-password index is given and contains the password, zxcvbn is skipped and 0 is returned.
     
     :param password: password to analyze
+    :param index: optional PasswordIndex of known-compromised passwords
     :return: entropy value (in bits)"""
     validate_password(password)
+    if index is not None and password in index:
+        return 0.0
     try:
         result = zxcvbn(password)
         return math.log2(result['guesses'])
@@ -70,8 +82,10 @@ def calculate_max_relative_entropy(password):
 
     return calculate_max_entropy(password, length_alphabet)
 
-def is_password_secure(password):
+def is_password_secure(password, index=None):
     validate_password(password)
+    if index is not None and password in index:
+        return False
     entropy = calculate_max_entropy(password)
     return entropy >= 80
 
@@ -79,6 +93,97 @@ def validate_password(password):
     if not password or not isinstance(password, str):
         raise ValueError("Le mot de passe doit être une chaîne de caractères non vide.")
 
+def hash_password(password):
+    """
+    Hash a password (str or bytes) into the 64-bit integer stored in a common-password index.
+    
+    :param password: password to hash
+    :return: 64-bit hash value"""
+    if isinstance(password, str):
+        password = password.encode("utf-8")
+    return int.from_bytes(hashlib.blake2b(password, digest_size=8).digest(), "little")
+
+def build_password_index(wordlist_path, index_path):
+    """
+    Build a common-password index from a wordlist (one password per line).
+    The index is a header followed by the sorted, deduplicated 64-bit hashes of the passwords.
+    
+    :param wordlist_path: path to the wordlist
+    :param index_path: path of the index file to write
+    :return: number of passwords in the index"""
+    with open(wordlist_path, "rb") as wordlist:
+        hashes = np.fromiter(
+            (hash_password(line.rstrip(b"\r\n")) for line in wordlist if line.rstrip(b"\r\n")),
+            dtype=PASSWORD_INDEX_DTYPE,
+        )
+    hashes = np.unique(hashes)
+    with open(index_path, "wb") as index_file:
+        index_file.write(PASSWORD_INDEX_MAGIC)
+        index_file.write(len(hashes).to_bytes(8, "little"))
+        index_file.write(hashes.tobytes())
+    return len(hashes)
+
+class PasswordIndex:
+    def __init__(self, index_path):
+        """
+        Load a common-password index built by build_password_index.
+        The hashes are memory-mapped: loading costs no parse time and pages are read on demand.
+        Lookups use a binary search (O(log n)).
+        
+        :param index_path: path to the index file"""
+        with open(index_path, "rb") as index_file:
+            header = index_file.read(PASSWORD_INDEX_HEADER_SIZE)
+            index_file.seek(0, 2)
+            file_size = index_file.tell()
+        if len(header) != PASSWORD_INDEX_HEADER_SIZE or header[:8] != PASSWORD_INDEX_MAGIC:
+            raise ValueError("Le fichier d'index des mots de passe est invalide.")
+        count = int.from_bytes(header[8:], "little")
+        if file_size != PASSWORD_INDEX_HEADER_SIZE + count * PASSWORD_INDEX_DTYPE.itemsize:
+            raise ValueError("Le fichier d'index des mots de passe est tronqué ou corrompu.")
+        if count:
+            self._hashes = np.memmap(index_path, dtype=PASSWORD_INDEX_DTYPE, mode="r",
+                                    offset=PASSWORD_INDEX_HEADER_SIZE, shape=(count,))
+        else:
+            self._hashes = np.empty(0, dtype=PASSWORD_INDEX_DTYPE)
+
+    def close(self):
+        """
+        Drop the reference to the memory-mapped hashes.
+        NumPy unmaps the file once no array uses the mapping any more."""
+        self._hashes = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def _get_hashes(self):
+        hashes = self._hashes
+        if hashes is None:
+            raise ValueError("L'index des mots de passe est fermé.")
+        return hashes
+
+    def __len__(self):
+        return len(self._get_hashes())
+
+    def __contains__(self, password):
+        return bool(self.contains_many([password])[0])
+
+    def contains_many(self, passwords):
+        """
+        Check a batch of passwords against the index.
+        
+        :param passwords: iterable of passwords
+        :return: list of booleans, True for each known-compromised password"""
+        hashes = self._get_hashes()
+        queries = np.fromiter((hash_password(password) for password in passwords), dtype=PASSWORD_INDEX_DTYPE)
+        if not len(hashes):
+            return [False] * len(queries)
+        positions = np.searchsorted(hashes, queries)
+        found = hashes[np.minimum(positions, len(hashes) - 1)] == queries
+        return found.tolist()
+
 if __name__ == "__main__":
     password = "H€ll_Yeah!99"
     print("Mot de passe : ", password)
@@ -5,9 +5,73 @@ from math import gcd
 import secrets
 import json
 import logging
+from cipher_cache import CompiledCipher, cipher_cache
 
 logger = logging.getLogger("HillCipher")
 
+def _matrix_key(matrix):
+    """
+    Convertit une matrice (liste de listes ou tableau NumPy) en tuple de tuples hachable et non modifiable.
+    Les autres valeurs sont renvoyées telles quelles pour être refusées par validate_matrix.
+    """
+    if isinstance(matrix, np.ndarray):
+        matrix = matrix.tolist()
+    if isinstance(matrix, list) and all(isinstance(row, list) for row in matrix):
+        return tuple(tuple(row) for row in matrix)
+    return matrix
+
+def _matrix_list(matrix):
+    """Convertit une matrice figée par _matrix_key en nouvelle liste de listes."""
+    if isinstance(matrix, tuple):
+        return [list(row) for row in matrix]
+    return matrix
+
+class CompiledHill(CompiledCipher):
+    __slots__ = ("block_size", "key_matrix", "key_matrix_inverse")
+
+    def __init__(self, key_matrix, key_matrix_inverse=None):
+        """
+        Clé de Hill compilée : les matrices de clé et inverse sont converties une seule fois en tableaux NumPy.
+
+        :param key_matrix: matrice de clé (tuple de tuples)
+        :param key_matrix_inverse: matrice inverse de la clé (tuple de tuples), ou None
+        """
+        key_array = np.array(key_matrix, dtype=np.int64)
+        key_array.setflags(write=False)
+        inverse_array = None
+        if key_matrix_inverse is not None:
+            inverse_array = np.array(key_matrix_inverse, dtype=np.int64)
+            inverse_array.setflags(write=False)
+        object.__setattr__(self, "block_size", len(key_matrix))
+        object.__setattr__(self, "key_matrix", key_array)
+        object.__setattr__(self, "key_matrix_inverse", inverse_array)
+
+    def select_matrix(self, mod=0):
+        """
+        Renvoie la matrice de clé (mod=0) ou la matrice inverse (mod=1).
+
+        :param mod: 0 pour le chiffrement, 1 pour le déchiffrement
+        :return: tableau NumPy de la matrice sélectionnée
+        """
+        matrix = self.key_matrix if mod == 0 else self.key_matrix_inverse
+        if matrix is None:
+            logger.error("La matrice inverse n'est pas définie.")
+            raise ValueError("La matrice inverse n'est pas définie.")
+        return matrix
+
+    def transform(self, blocks, mod=0):
+        """
+        Applique la matrice de clé (mod=0) ou la matrice inverse (mod=1) à une liste de blocs de texte.
+
+        :param blocks: blocs de lettres majuscules de la taille de la matrice sélectionnée
+        :param mod: 0 pour le chiffrement, 1 pour le déchiffrement
+        :return: texte chiffré ou déchiffré
+        """
+        matrix = self.select_matrix(mod)
+        letters = np.array([[ord(car) - 65 for car in block] for block in blocks], dtype=np.int64)
+        result = (letters @ matrix.T) % 26 + 65
+        return "".join(map(chr, result.ravel().tolist()))
+
 class HillCipher():
     def __init__(self, load_from_env=True):
         """
@@ -27,6 +91,24 @@ class HillCipher():
         logger.debug("Clé et matrice inverse initialisées.")
 
 
+    # Les matrices sont figées à l'affectation : la lecture renvoie une copie, une modification en place
+    # ne peut donc pas désynchroniser la clé compilée.
+    @property
+    def key_matrix(self):
+        return _matrix_list(self._key_matrix)
+
+    @key_matrix.setter
+    def key_matrix(self, matrix):
+        self._key_matrix = _matrix_key(matrix)
+
+    @property
+    def key_matrix_inverse(self):
+        return _matrix_list(self._key_matrix_inverse)
+
+    @key_matrix_inverse.setter
+    def key_matrix_inverse(self, matrix):
+        self._key_matrix_inverse = _matrix_key(matrix)
+
     def load_key_matrix(self):
         """
         Charge la matrice de la clé et la matrice inverse de la clé à partir des variables d'environnement.
@@ -189,6 +271,35 @@ class HillCipher():
         logger.debug("Matrice inverse calculée avec succès.")
         return inverse.tolist()
 
+    def compile(self, key_matrix=None, key_matrix_inverse=None):
+        """
+        Compile une matrice de clé et sa matrice inverse. L'objet compilé est conservé dans le cache LRU partagé.
+        Par défaut, les matrices de l'instance sont utilisées.
+
+        :param key_matrix: matrice de clé
+        :param key_matrix_inverse: matrice inverse de la clé
+        :return: objet CompiledHill
+        """
+        if key_matrix is None:
+            key_matrix = self._key_matrix
+            if key_matrix_inverse is None:
+                key_matrix_inverse = self._key_matrix_inverse
+        if key_matrix is None:
+            logger.error("La matrice de clé n'est pas définie.")
+            raise ValueError("La matrice de clé n'est pas définie.")
+        key = (_matrix_key(key_matrix), _matrix_key(key_matrix_inverse))
+        for matrix in key:
+            if matrix is not None and not isinstance(matrix, tuple):
+                self.validate_matrix(matrix)
+
+        def factory():
+            for matrix in key:
+                if matrix is not None:
+                    self.validate_matrix(_matrix_list(matrix))
+            return CompiledHill(*key)
+
+        return cipher_cache.get_or_compile("hill", key, factory)
+
     def split_text(self, text, size=4):
         """
         Divise le texte en blocs de taille size. Les caractères non alphabétiques sont ignorés.
@@ -222,20 +333,14 @@ class HillCipher():
         :return: texte chiffré ou déchiffré
         """
         logger.debug("Début du chiffrement/déchiffrement du texte.")
-        matrix = self.key_matrix if mod == 0 else self.key_matrix_inverse
-        block_size = len(matrix)
+        compiled = self.compile()
+        block_size = len(compiled.select_matrix(mod))
         text = self.split_text(text, block_size)
-        encrypted_text = ""
         for block in text:
             if len(block) != block_size:
                 logger.error("La taille du bloc ne correspond pas à la taille de la matrice.")
                 raise ValueError("La taille du bloc ne correspond pas à la taille de la matrice.")
-            for i in range(len(block)):
-                somme = 0
-                for j in range(len(block)):
-                    letter_nbr = ord(block[j]) - 65
-                    somme += letter_nbr * matrix[i][j]
-                encrypted_text += chr((somme % 26) + 65)
+        encrypted_text = compiled.transform(text, mod)
         logger.debug("Chiffrement/déchiffrement terminé.")
         return encrypted_text
 
@@ -247,7 +352,7 @@ class HillCipher():
         :return: texte déchiffré
         """
         logger.debug("Début du déchiffrement du texte.")
-        if not self.key_matrix_inverse:
+        if not self._key_matrix_inverse:
             logger.error("La matrice inverse n'est pas définie.")
             raise ValueError("La matrice inverse n'est pas définie.")
         result = self.hill_encryption(text, 1)
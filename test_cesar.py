@@ -69,4 +69,22 @@ def test_frequency_analysis(cipher):
     estimated_key = cipher.frequency_analysis(text)
     assert estimated_key == 3 
     decrypted = cipher.cesar_decryption(text, estimated_key)
-    assert decrypted == "DEMAINDESLAUBEALHEUREOUBLANCHITLACAMPAGNEJEPARTIRAIVOISTUJESAISQUETUMATTENDSJIRAIPARLAFORETJIRAIPARLAMONTAGNEJENEPUISDEMEURERLOINDETOIPLUSLONGTEMPSJEMARCHERAILESYEUXFIXESSURMESPENSEESSANSRIENVOIRAUDEHORSSANSENTENDREAUCUNBRUITSEULINCONNULEDOSCOURBELESMAINSCROISEESTRISTEETLEJOURPOURMOISERACOMMELANUITJENEREGARDERAINILORDUSOIRQUITOMBENILESVOILESAULOINDESCENDANTVERSHARFLEURETQUANDJARRIVERAIJEMETTRAISURTATOMBEUNBOUQUETDEHOUXVERTETDEBRUYEREENFLEURDEMAINDESLAUBE" 
\ No newline at end of file
+    assert decrypted == "DEMAINDESLAUBEALHEUREOUBLANCHITLACAMPAGNEJEPARTIRAIVOISTUJESAISQUETUMATTENDSJIRAIPARLAFORETJIRAIPARLAMONTAGNEJENEPUISDEMEURERLOINDETOIPLUSLONGTEMPSJEMARCHERAILESYEUXFIXESSURMESPENSEESSANSRIENVOIRAUDEHORSSANSENTENDREAUCUNBRUITSEULINCONNULEDOSCOURBELESMAINSCROISEESTRISTEETLEJOURPOURMOISERACOMMELANUITJENEREGARDERAINILORDUSOIRQUITOMBENILESVOILESAULOINDESCENDANTVERSHARFLEURETQUANDJARRIVERAIJEMETTRAISURTATOMBEUNBOUQUETDEHOUXVERTETDEBRUYEREENFLEURDEMAINDESLAUBE" 
+
+def test_compile(cipher):
+    compiled = cipher.compile(3)
+    assert cipher.compile(3) is compiled
+    assert compiled.encrypt("Hello World!") == "KHOORZRUOG"
+    assert compiled.decrypt("KHOOR") == "HELLO"
+    with pytest.raises(AttributeError):
+        compiled.key = 4
+    with pytest.raises(ValueError, match="La clé ne peut pas être vide."):
+        cipher.compile(0)
+
+def test_compiled_table_is_read_only(cipher):
+    compiled = cipher.compile(3)
+    with pytest.raises(TypeError):
+        compiled._encrypt_table[65] = "Q"
+    with pytest.raises(TypeError):
+        compiled._decrypt_table[65] = "Q"
+    assert cipher.cesar_encryption("AAA", 3) == "DDD"
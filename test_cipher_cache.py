@@ -0,0 +1,34 @@
+import pytest
+from cipher_cache import CipherCache
+
+def test_get_or_compile_hits_and_misses():
+    cache = CipherCache(maxsize=2)
+    first = cache.get_or_compile("cesar", 3, object)
+    assert cache.get_or_compile("cesar", 3, object) is first
+    assert cache.get_or_compile("vigenere", 3, object) is not first
+    stats = cache.stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 2
+    assert stats["hit_rate"] == pytest.approx(1 / 3)
+    assert stats["size"] == 2
+
+def test_lru_eviction():
+    cache = CipherCache(maxsize=2)
+    first = cache.get_or_compile("cesar", 1, object)
+    cache.get_or_compile("cesar", 2, object)
+    cache.get_or_compile("cesar", 1, object)
+    cache.get_or_compile("cesar", 3, object)
+    assert cache.get_or_compile("cesar", 1, object) is first
+    assert cache.stats()["size"] == 2
+    cache.get_or_compile("cesar", 2, object)
+    assert cache.stats()["misses"] == 4
+
+def test_clear():
+    cache = CipherCache()
+    cache.get_or_compile("cesar", 3, object)
+    cache.clear()
+    assert cache.stats() == {"hits": 0, "misses": 0, "hit_rate": 0.0, "size": 0, "maxsize": 128}
+
+def test_invalid_maxsize():
+    with pytest.raises(ValueError, match="La taille du cache doit être un entier supérieur à 0."):
+        CipherCache(maxsize=0)
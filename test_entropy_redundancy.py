@@ -0,0 +1,67 @@
+import pytest
+from entropy_redundancy import PasswordIndex, build_password_index, calculate_entropy, calculate_redundancy, is_password_secure
+
+@pytest.fixture
+def index_path(tmp_path):
+    """Fixture pour construire le fichier d'index des mots de passe courants."""
+    wordlist = tmp_path / "wordlist.txt"
+    wordlist.write_text("123456\npassword\np'tite_d0uc€ur!\n\npassword\n", encoding="utf-8")
+    index_path = tmp_path / "passwords.idx"
+    assert build_password_index(wordlist, index_path) == 3
+    return index_path
+
+@pytest.fixture
+def index(index_path):
+    """Fixture pour charger l'index des mots de passe courants."""
+    with PasswordIndex(index_path) as index:
+        yield index
+
+def test_password_index_lookup(index):
+    assert len(index) == 3
+    assert "password" in index
+    assert "p'tite_d0uc€ur!" in index
+    assert "H€ll_Yeah!99" not in index
+    assert index.contains_many(["123456", "H€ll_Yeah!99", "password"]) == [True, False, True]
+
+def test_compromised_password_is_insecure(index):
+    assert is_password_secure("p'tite_d0uc€ur!") is True
+    assert is_password_secure("p'tite_d0uc€ur!", index) is False
+    assert calculate_entropy("password", index) == 0.0
+
+def test_compromised_password_redundancy(index):
+    assert calculate_redundancy("password", index) == 1.0
+
+def test_empty_index(tmp_path):
+    wordlist = tmp_path / "wordlist.txt"
+    wordlist.write_text("", encoding="utf-8")
+    index_path = tmp_path / "passwords.idx"
+    build_password_index(wordlist, index_path)
+    with PasswordIndex(index_path) as index:
+        assert len(index) == 0
+        assert index.contains_many(["password"]) == [False]
+
+def test_invalid_index(tmp_path):
+    index_path = tmp_path / "passwords.idx"
+    index_path.write_bytes(b"not an index file")
+    with pytest.raises(ValueError, match="Le fichier d'index des mots de passe est invalide."):
+        PasswordIndex(index_path)
+
+def test_truncated_index(tmp_path, index_path):
+    truncated_path = tmp_path / "truncated.idx"
+    truncated_path.write_bytes(index_path.read_bytes()[:-8])
+    with pytest.raises(ValueError, match="Le fichier d'index des mots de passe est tronqué ou corrompu."):
+        PasswordIndex(truncated_path)
+
+def test_close(index_path):
+    with PasswordIndex(index_path) as index:
+        assert "password" in index
+    with pytest.raises(ValueError, match="L'index des mots de passe est fermé."):
+        "password" in index
+    index.close()
+
+def test_close_keeps_existing_views_valid(index_path):
+    index = PasswordIndex(index_path)
+    view = index._hashes[:2]
+    expected = view.tolist()
+    index.close()
+    assert view.tolist() == expected
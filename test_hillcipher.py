@@ -1,5 +1,6 @@
 import pytest
 from hillcipher import HillCipher
+from cipher_cache import cipher_cache
 
 @pytest.fixture
 def cipher():
@@ -86,4 +87,50 @@ def test_hill_decryption(cipher):
 
     with pytest.raises(ValueError, match="La matrice inverse n'est pas définie."):
         cipher.key_matrix_inverse = None
-        cipher.hill_decryption("HELLO")
\ No newline at end of file
+        cipher.hill_decryption("HELLO")
+
+def test_compile(cipher):
+    """Test de la méthode compile."""
+    compiled = cipher.compile([[1, 2], [3, 5]], [[21, 2], [3, 25]])
+    assert cipher.compile([[1, 2], [3, 5]], [[21, 2], [3, 25]]) is compiled
+    assert compiled.block_size == 2
+    encrypted = compiled.transform(["HE", "LL", "OX"])
+    assert compiled.transform(cipher.split_text(encrypted, 2), 1) == "HELLOX"
+
+    with pytest.raises(AttributeError):
+        compiled.block_size = 3
+    with pytest.raises(ValueError, match="La matrice inverse n'est pas définie."):
+        cipher.compile([[1, 2], [3, 5]]).transform(["HE"], 1)
+
+def test_compiled_key_follows_reassignment(cipher):
+    """Test de la recompilation après réaffectation des matrices."""
+    cipher.key_matrix = [[1, 2], [3, 5]]
+    cipher.key_matrix_inverse = [[21, 2], [3, 25]]
+    encrypted = cipher.hill_encryption("HELLO")
+    assert len(encrypted) == 6
+    assert cipher.hill_decryption(encrypted) == "HELLOX"
+
+    # La taille des blocs de déchiffrement est celle de la matrice inverse.
+    cipher.key_matrix_inverse = [[1, 0, 0], [0, 1, 0], [0, 0, 1]]
+    assert cipher.hill_decryption("HELLO") == "HELLOX"
+
+def test_key_matrix_in_place_change(cipher):
+    """Test qu'une modification en place de la matrice ne laisse pas de clé compilée obsolète."""
+    encrypted = cipher.hill_encryption("HELLO")
+    cipher.key_matrix[0][0] = 1
+    assert cipher.key_matrix[0][0] == 16
+    assert cipher.hill_encryption("HELLO") == encrypted
+
+    matrix = cipher.key_matrix
+    matrix[0][0] = 1
+    cipher.key_matrix = matrix
+    assert cipher.hill_encryption("HELLO") != encrypted
+
+def test_hill_encryption_uses_shared_cache(cipher):
+    """Test que le chiffrement de Hill passe par le cache partagé."""
+    cipher_cache.clear()
+    cipher.hill_encryption("HELLO")
+    cipher.hill_encryption("HELLO")
+    stats = cipher_cache.stats()
+    assert stats["misses"] == 1
+    assert stats["hits"] == 1
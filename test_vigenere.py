@@ -19,4 +19,14 @@ def test_vigenere_encryption(cipher):
     with pytest.raises(TypeError, match="La chaîne à chiffrer doit être une chaîne de caractères."):
         cipher.vigenere_encryption(12345, "KEY")
     with pytest.raises(TypeError, match="La clé doit être une chaîne de caractères."):
-        cipher.vigenere_encryption("HELLO", 12345)
\ No newline at end of file
+        cipher.vigenere_encryption("HELLO", 12345)
+
+def test_compile(cipher):
+    compiled = cipher.compile("key")
+    assert cipher.compile("key") is compiled
+    assert compiled.shifts == (10, 4, 24)
+    assert compiled.encrypt("HELLO WORLD!") == "RIJVSUYVJN"
+    with pytest.raises(AttributeError):
+        compiled.shifts = (0,)
+    with pytest.raises(ValueError, match="La clé doit contenir uniquement des lettres."):
+        cipher.compile("K3Y!")
@@ -1,4 +1,4 @@
-from cesar import CesarCipher
+from cipher_cache import CompiledCipher, cipher_cache
 import logging
 
 logging.basicConfig(
@@ -11,10 +11,64 @@ logging.basicConfig(
 
 logger = logging.getLogger("VigenereCipher")
 
+class CompiledVigenere(CompiledCipher):
+    __slots__ = ("key", "shifts", "_alphabets")
+
+    def __init__(self, key):
+        """
+        Clé de Vigenère compilée : les décalages et les alphabets chiffrés de chaque lettre de la clé sont précalculés.
+
+        :param key: clé alphabétique
+        """
+        shifts = tuple(ord(letter) - 65 for letter in key.upper())
+        # Un décalage nul (lettre 'A') est refusé par CesarCipher : on conserve ce comportement au chiffrement.
+        alphabets = tuple(
+            "".join(chr((i + shift) % 26 + 65) for i in range(26)) if shift else None
+            for shift in shifts
+        )
+        object.__setattr__(self, "key", key)
+        object.__setattr__(self, "shifts", shifts)
+        object.__setattr__(self, "_alphabets", alphabets)
+
+    def encrypt(self, chain):
+        alphabets = self._alphabets
+        key_length = len(alphabets)
+        keyIndex = 0
+        newChain = []
+        for elt in chain.upper():
+            if elt.isalpha():
+                alphabet = alphabets[keyIndex]
+                if alphabet is None:
+                    logger.error("ValueError : La clé ne peut pas être vide.")
+                    raise ValueError("La clé ne peut pas être vide.")
+                car = ord(elt) - 65
+                if 0 <= car < 26:
+                    newChain.append(alphabet[car])
+                keyIndex = (keyIndex + 1) % key_length
+        return "".join(newChain)
+
 class VigenereCipher:
     def __init__(self):
         pass
 
+    def compile(self, key):
+        """
+        Compile une clé de Vigenère. L'objet compilé est conservé dans le cache LRU partagé.
+
+        :param key: clé alphabétique
+        :return: objet CompiledVigenere
+        """
+        if not isinstance(key, str):
+            logger.error("TypeError : La clé doit être une chaîne de caractères.")
+            raise TypeError("La clé doit être une chaîne de caractères.")
+        if not key:
+            logger.error("ValueError : La clé ne peut pas être vide.")
+            raise ValueError("La clé ne peut pas être vide.")
+        if not key.isalpha():
+            logger.error("ValueError : La clé doit contenir uniquement des lettres.")
+            raise ValueError("La clé doit contenir uniquement des lettres.")
+        return cipher_cache.get_or_compile("vigenere", key, lambda: CompiledVigenere(key))
+
     def vigenere_encryption(self, chain, key):
         """
         Encrypts a string using the Vigenère cipher with a given key.
@@ -30,30 +84,11 @@ class VigenereCipher:
         if not isinstance(chain, str):
             logger.error("TypeError : La chaîne à chiffrer doit être une chaîne de caractères.")
             raise TypeError("La chaîne à chiffrer doit être une chaîne de caractères.")
-        if not isinstance(key, str):
-            logger.error("TypeError : La clé doit être une chaîne de caractères.")
-            raise TypeError("La clé doit être une chaîne de caractères.")
         if not chain:
             logger.error("ValueError : La chaîne à chiffrer ne peut pas être vide.")
             raise ValueError("La chaîne à chiffrer ne peut pas être vide.")
-        if not key:
-            logger.error("ValueError : La clé ne peut pas être vide.")
-            raise ValueError("La clé ne peut pas être vide.")
-        if not key.isalpha():
-            logger.error("ValueError : La clé doit contenir uniquement des lettres.")
-            raise ValueError("La clé doit contenir uniquement des lettres.")
-
-        keyIndex = 0
-        key = key.upper()
-        chain = chain.upper()
-
-        newChain = []
-        for elt in chain:
-            if elt.isalpha():
-                newChain.append(CesarCipher().cesar_encryption(elt, ord(key[keyIndex]) - 65))
-                keyIndex = (keyIndex + 1) % len(key)
 
-        encrypted_chain = "".join(newChain)
+        encrypted_chain = self.compile(key).encrypt(chain)
         logger.debug("Chiffrement terminé. Résultat : '%s'.", encrypted_chain)
         return encrypted_chain
  